@@ -10,48 +10,99 @@ Organización: Órgano de Fiscalización Superior del Estado de Tlaxcala
 """
 
 import logging
+import tempfile
 from io import BytesIO
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Dict, Any
+from typing import IO, Tuple, Dict, Any
 from logging.handlers import RotatingFileHandler
 
+import orjson
 import pandas as pd
 from flask import Flask, render_template, request, send_file, jsonify, Response
+from flask.json.provider import JSONProvider
 from werkzeug.exceptions import RequestEntityTooLarge
 
 from config import Config
-from scripts.converter import numero_a_texto
-from scripts.excel_processor import find_num_column
+from scripts.converter import numero_a_texto, convertir_valores
+from scripts.excel_processor import find_num_column, parse_num_column
 from scripts.validators import validate_file
 
 
 # =========================================================
 # INICIALIZACIÓN DE FLASK
 # =========================================================
+class OrjsonProvider(JSONProvider):
+    """
+    Proveedor JSON de Flask respaldado por orjson.
+
+    Los ``**kwargs`` de ``dumps``/``loads`` (``indent``, ``sort_keys``,
+    ``default``, etc.) se ignoran: orjson siempre produce JSON compacto,
+    sin ordenar llaves, y solo serializa tipos nativos (dict, list, str,
+    números, bool, None, fechas).
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 app.config.from_object(Config)
+app.json = OrjsonProvider(app)
 
 
 # =========================================================
-# CONFIGURACIÓN DE LOGGING
+# VALORES DE CONFIGURACIÓN USADOS EN CADA PETICIÓN
 # =========================================================
-Config.LOG_DIR.mkdir(exist_ok=True)
-file_handler = RotatingFileHandler(
-    Config.LOG_FILE,
-    maxBytes=Config.LOG_MAX_BYTES,
-    backupCount=Config.LOG_BACKUP_COUNT
+_ERR_NO_FILE = Config.ERROR_NO_FILE
+_ERR_INVALID_EXCEL = Config.ERROR_INVALID_EXCEL
+_ERR_NO_COLUMN = Config.ERROR_NO_COLUMN
+_ERR_CONVERSION = Config.ERROR_CONVERSION
+_OUTPUT = Config.OUTPUT_FILENAME
+_OUTPUT_CSV = Config.OUTPUT_FILENAME_CSV
+_MAX_MB = Config.MAX_FILE_SIZE_MB
+_SPOOL_MAX_SIZE = Config.SPOOL_MAX_SIZE
+
+_SECURITY_HEADERS = (
+    ("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0"),
+    ("Pragma", "no-cache"),
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("X-XSS-Protection", "1; mode=block"),
 )
-file_handler.setLevel(getattr(logging, Config.LOG_LEVEL))
-file_handler.setFormatter(logging.Formatter(Config.LOG_FORMAT))
 
-console_handler = logging.StreamHandler()
-console_handler.setLevel(getattr(logging, Config.LOG_LEVEL))
-console_handler.setFormatter(logging.Formatter(Config.LOG_FORMAT))
 
-app.logger.addHandler(file_handler)
-app.logger.addHandler(console_handler)
-app.logger.setLevel(getattr(logging, Config.LOG_LEVEL))
-app.logger.info("LexNum iniciado correctamente")
+# =========================================================
+# CONFIGURACIÓN DE LOGGING
+# =========================================================
+# Los procesos hijos del pool de conversión (forkserver/spawn) re-ejecutan
+# este módulo como __mp_main__; solo el proceso principal configura logging
+if __name__ != "__mp_main__":
+    log_formatter = logging.Formatter(Config.LOG_FORMAT)
+
+    # RotatingFileHandler no es seguro entre procesos: con Gunicorn
+    # (LOG_TO_FILE=False) los registros van solo a stderr
+    if Config.LOG_TO_FILE:
+        Config.LOG_DIR.mkdir(exist_ok=True)
+        file_handler = RotatingFileHandler(
+            Config.LOG_FILE,
+            maxBytes=Config.LOG_MAX_BYTES,
+            backupCount=Config.LOG_BACKUP_COUNT
+        )
+        file_handler.setLevel(getattr(logging, Config.LOG_LEVEL))
+        file_handler.setFormatter(log_formatter)
+        app.logger.addHandler(file_handler)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(getattr(logging, Config.LOG_LEVEL))
+    console_handler.setFormatter(log_formatter)
+
+    app.logger.addHandler(console_handler)
+    app.logger.setLevel(getattr(logging, Config.LOG_LEVEL))
+    app.logger.info("LexNum iniciado correctamente")
 
 
 # =========================================================
@@ -69,6 +120,12 @@ def health() -> Tuple[Dict[str, str], int]:
     return jsonify({"status": "healthy", "service": "LexNum"}), 200
 
 
+@lru_cache(maxsize=Config.TEXT_CACHE_SIZE)
+def _convert_cached(numero_str: str) -> str:
+    """Convierte un número recibido como texto, con caché por proceso."""
+    return numero_a_texto(numero_str)
+
+
 @app.route("/convertir_texto", methods=["POST"])
 def convertir_texto() -> Tuple[Dict[str, Any], int]:
     """
@@ -84,32 +141,78 @@ def convertir_texto() -> Tuple[Dict[str, Any], int]:
         if not numero:
             return jsonify({"texto": ""}), 200
 
-        texto = numero_a_texto(numero)
-        app.logger.debug(f"Conversión: {numero} -> {texto}")
+        try:
+            texto = _convert_cached(str(numero))
+        except ValueError:
+            # Entrada no numérica: sin conversión
+            return jsonify({"texto": ""}), 200
+        app.logger.debug("Conversión: %s -> %s", numero, texto)
 
         return jsonify({"texto": texto}), 200
 
     except Exception as e:
-        app.logger.error(f"Error en convertir_texto: {e}")
+        app.logger.error("Error en convertir_texto: %s", e)
         return jsonify({
-            "error": Config.ERROR_CONVERSION
+            "error": _ERR_CONVERSION
         }), 500
 
 
+def _wants_csv() -> bool:
+    """Indica si el cliente pidió el resultado en CSV (?format=csv o Accept)."""
+    if request.args.get("format", "xlsx") == "csv":
+        return True
+    return request.accept_mimetypes.best == "text/csv"
+
+
+def _send_output(buf: IO[bytes], download_name: str, mimetype: str) -> Response:
+    """
+    Envía el archivo generado indicando su tamaño (Content-Length).
+
+    Hasta ``SPOOL_MAX_SIZE`` el contenido sigue en memoria y se entrega
+    como BytesIO: Gunicorn no llama a ``fileno()``, que forzaría el paso
+    a disco del SpooledTemporaryFile. Por encima del umbral el archivo ya
+    está en disco y Gunicorn puede enviarlo con sendfile. Werkzeug cierra
+    el archivo al terminar la respuesta.
+
+    No se usan respuestas condicionales ni Range: Werkzeug solo las aplica
+    a GET/HEAD y este archivo siempre se genera en un POST.
+    """
+    size = buf.tell()
+    buf.seek(0)
+
+    payload = buf
+    if size <= _SPOOL_MAX_SIZE:
+        payload = BytesIO(buf.read())
+        buf.close()
+
+    response = send_file(
+        payload,
+        as_attachment=True,
+        download_name=download_name,
+        mimetype=mimetype,
+        conditional=False
+    )
+    response.content_length = size
+    return response
+
+
 @app.route("/convertir_excel", methods=["POST"])
 def convertir_excel() -> Tuple[Response, int]:
     """
     Procesa un archivo Excel y retorna el resultado con conversiones.
 
+    El resultado es .xlsx por defecto, o CSV si se pide con ``?format=csv``
+    o ``Accept: text/csv``.
+
     Returns:
-        Archivo Excel con columna de texto agregada o error JSON
+        Archivo Excel (o CSV) con columna de texto agregada o error JSON
     """
     try:
         # Validar que se subió un archivo
         archivo = request.files.get("archivo")
         if not archivo:
             return jsonify({
-                "error": Config.ERROR_NO_FILE
+                "error": _ERR_NO_FILE
             }), 400
 
         # Validar el archivo
@@ -117,43 +220,52 @@ def convertir_excel() -> Tuple[Response, int]:
         if not is_valid:
             return jsonify({"error": error_message}), 400
 
-        # Leer Excel
+        # Leer Excel (.xlsx y .xls) con el motor calamine
         try:
-            df = pd.read_excel(archivo)
-            app.logger.info(f"Excel leído: {len(df)} filas")
+            df = pd.read_excel(archivo, engine="calamine")
+            app.logger.info("Excel leído: %d filas", len(df))
         except Exception as e:
-            app.logger.error(f"Error leyendo Excel: {e}")
+            app.logger.error("Error leyendo Excel: %s", e)
             return jsonify({
-                "error": Config.ERROR_INVALID_EXCEL
+                "error": _ERR_INVALID_EXCEL
             }), 400
 
         # Encontrar columna de números
         col = find_num_column(df)
         if not col:
             return jsonify({
-                "error": Config.ERROR_NO_COLUMN
+                "error": _ERR_NO_COLUMN
             }), 400
 
-        # Aplicar conversión
-        df["Texto"] = df[col].apply(numero_a_texto)
-        app.logger.info(f"Conversiones aplicadas en columna: {col}")
-
-        # Generar archivo Excel en memoria
-        buf = BytesIO()
-        with pd.ExcelWriter(buf, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False)
-        buf.seek(0)
-
-        # Enviar archivo
-        return send_file(
-            buf,
-            as_attachment=True,
-            download_name=Config.OUTPUT_FILENAME,
-            mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        ), 200
+        # Limpiar la columna y convertir una sola vez por valor único;
+        # las celdas vacías o inválidas (NaN) quedan con texto vacío
+        numeros = parse_num_column(df[col])
+        mask = numeros.notna()
+        unicos = numeros[mask].unique()
+        mapping = dict(zip(unicos, convertir_valores(unicos.tolist())))
+        df["Texto"] = ""
+        df.loc[mask, "Texto"] = numeros[mask].map(mapping)
+        app.logger.info("Conversiones aplicadas en columna: %s", col)
+
+        # Generar archivo (en memoria hasta SPOOL_MAX_SIZE, luego en disco)
+        buf = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE, mode="w+b")
+        try:
+            if _wants_csv():
+                df.to_csv(buf, index=False, encoding="utf-8-sig")
+                download_name = _OUTPUT_CSV
+                mimetype = "text/csv"
+            else:
+                with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+                    df.to_excel(writer, index=False)
+                download_name = _OUTPUT
+                mimetype = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            return _send_output(buf, download_name, mimetype), 200
+        except Exception:
+            buf.close()
+            raise
 
     except Exception as e:
-        app.logger.error(f"Error en convertir_excel: {e}")
+        app.logger.error("Error en convertir_excel: %s", e)
         return jsonify({
             "error": "Error interno del servidor."
         }), 500
@@ -166,7 +278,7 @@ def convertir_excel() -> Tuple[Response, int]:
 @app.errorhandler(RequestEntityTooLarge)
 def handle_large_file(e):
     """Maneja archivos que exceden el tamaño máximo."""
-    max_size = Config.MAX_FILE_SIZE_MB
+    max_size = _MAX_MB
     return jsonify({
         "error": f"El archivo excede el tamaño máximo permitido de {max_size} MB."
     }), 413
@@ -181,7 +293,7 @@ def handle_not_found(e):
 @app.errorhandler(500)
 def handle_internal_error(e):
     """Maneja errores internos del servidor."""
-    app.logger.error(f"Error interno: {e}")
+    app.logger.error("Error interno: %s", e)
     return jsonify({"error": "Error interno del servidor."}), 500
 
 
@@ -191,17 +303,16 @@ def handle_internal_error(e):
 @app.after_request
 def add_security_headers(response: Response) -> Response:
     """Agrega encabezados de seguridad a todas las respuestas."""
-    response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
+    headers = response.headers
+    for name, value in _SECURITY_HEADERS:
+        headers[name] = value
     return response
 
 
 # =========================================================
 # PUNTO DE ENTRADA
 # =========================================================
+# Solo para desarrollo local; en producción usar: gunicorn app:app
 if __name__ == "__main__":
     app.run(
         host=Config.HOST,
@@ -35,8 +35,22 @@ class Config:
     ALLOWED_EXTENSIONS = frozenset(["xlsx", "xls"])
     MAX_FILE_SIZE_MB = 10
 
+    # Procesos para convertir lotes grandes dentro de una petición.
+    # 1 = desactivado; con Gunicorn, workers × CONVERSION_WORKERS no debe
+    # superar el número de núcleos
+    CONVERSION_WORKERS = int(os.getenv("CONVERSION_WORKERS", "1"))
+
     # Nombres de archivos de salida
     OUTPUT_FILENAME = "resultado_lexnum.xlsx"
+    OUTPUT_FILENAME_CSV = "resultado_lexnum.csv"
+
+    # Tamaño a partir del cual el archivo de salida pasa de memoria a disco.
+    # Por debajo se responde desde memoria; por encima, desde el archivo
+    # temporal (Gunicorn lo envía con sendfile)
+    SPOOL_MAX_SIZE = 4 * 1024 * 1024  # 4 MB
+
+    # Caché por proceso de /convertir_texto
+    TEXT_CACHE_SIZE = 10_000
 
     # Mensajes de error
     ERROR_NO_FILE = "No se subió archivo."
@@ -50,6 +64,8 @@ class Config:
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_FILE = LOG_DIR / 'lexnum.log'
+    # Archivo rotativo solo con un proceso (python app.py); Gunicorn lo desactiva
+    LOG_TO_FILE = os.getenv("LOG_TO_FILE", "True").lower() in ("true", "1", "yes")
     LOG_MAX_BYTES = 10 * 1024 * 1024  # 10MB
     LOG_BACKUP_COUNT = 5
 
@@ -0,0 +1,38 @@
+"""
+LexNum - Configuración de Gunicorn
+===================================
+
+Configuración del servidor WSGI para producción. La conversión de números
+a texto es CPU-bound, por lo que se usan varios procesos sync para que
+las peticiones concurrentes no compitan por el GIL.
+
+Uso: gunicorn app:app
+
+Autor: Omar Gabriel Salvatierra Garcia
+Organización: Órgano de Fiscalización Superior del Estado de Tlaxcala
+"""
+
+import os
+
+# Varios workers no pueden compartir el RotatingFileHandler de la app:
+# se registra en stderr y Gunicorn (o systemd/journald) gestiona los archivos.
+# Debe definirse antes de importar Config.
+os.environ.setdefault("LOG_TO_FILE", "False")
+
+from config import Config
+
+
+# =========================================================
+# SERVIDOR
+# =========================================================
+bind = f"{Config.HOST}:{Config.PORT}"
+workers = int(os.getenv("GUNICORN_WORKERS", os.cpu_count() or 1))
+worker_class = "sync"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+
+
+# =========================================================
+# LOGGING
+# =========================================================
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-")
+errorlog = os.getenv("GUNICORN_ERRORLOG", "-")
@@ -10,7 +10,8 @@ Organización: Órgano de Fiscalización Superior del Estado de Tlaxcala
 
 import re
 import unicodedata
-from typing import Optional, Any
+from functools import lru_cache
+from typing import Optional, Any, Tuple
 
 import pandas as pd
 
@@ -20,6 +21,21 @@ import pandas as pd
 # =========================================================
 COLUMN_ALIASES = frozenset({"numero", "num"})
 
+# Encabezados exactos más comunes, aceptados sin normalizar
+_FAST_HEADERS = frozenset(
+    {"Número", "Numero", "numero", "NUMERO", "Num", "num", "NUM"}
+)
+
+# Tabla de traducción: vocales acentuadas y eñe a ASCII, elimina espacios
+_ACCENT_MAP = str.maketrans(
+    "áéíóúñÁÉÍÓÚÑüÜ",
+    "aeiounAEIOUNuU",
+    " \t\n\r\f\v\xa0",
+)
+
+# Símbolos de moneda, separadores y espacios a remover antes de convertir
+_CURRENCY_RE = re.compile(r"[$,\s]|MXN|M\.N\.|MN")
+
 
 # =========================================================
 # FUNCIONES DE NORMALIZACIÓN
@@ -41,14 +57,19 @@ def normalize(text: Any) -> str:
         'num'
     """
     text_str = str(text)
-    # Normalizar caracteres Unicode (remover acentos)
+
+    # Caso común: acentos españoles precompuestos y espacios ASCII
+    fast = text_str.translate(_ACCENT_MAP)
+    if fast.isascii():
+        return fast.lower()
+
+    # Resto de casos (acentos descompuestos, otros diacríticos, espacios
+    # Unicode): normalización NFKD y filtrado de caracteres combinantes
     normalized = unicodedata.normalize("NFKD", text_str)
-    # Filtrar caracteres combinantes (acentos)
     without_accents = "".join(
         char for char in normalized
         if not unicodedata.combining(char)
     )
-    # Remover espacios y convertir a minúsculas
     return re.sub(r"\s+", "", without_accents).lower()
 
 
@@ -70,7 +91,61 @@ def find_num_column(df: pd.DataFrame) -> Optional[str]:
         >>> find_num_column(df)
         'Número'
     """
-    for column in df.columns:
-        if normalize(column) in COLUMN_ALIASES:
+    return _find_alias_column(tuple(df.columns))
+
+
+@lru_cache(maxsize=128)
+def _find_alias_column(columns: Tuple[Any, ...]) -> Optional[str]:
+    """
+    Busca, en el orden de la hoja, la primera columna que sea un alias válido.
+
+    Los encabezados exactos más comunes se aceptan sin normalizar. El
+    resultado se guarda en caché por esquema de columnas, de modo que
+    archivos con los mismos encabezados no vuelven a normalizarse.
+    """
+    for column in columns:
+        if column in _FAST_HEADERS or normalize(column) in COLUMN_ALIASES:
             return column
     return None
+
+
+# =========================================================
+# FUNCIONES DE CONVERSIÓN
+# =========================================================
+def parse_num_column(series: pd.Series) -> pd.Series:
+    """
+    Convierte una columna de montos a valores numéricos de forma vectorizada.
+
+    Las columnas de texto se limpian de símbolos de moneda y separadores
+    con las operaciones de cadena de pandas y luego se convierten con
+    ``pd.to_numeric``. Los valores vacíos o inválidos, así como las
+    columnas de fechas, duraciones o booleanos, quedan como NaN.
+
+    Args:
+        series: Columna del DataFrame con los montos
+
+    Returns:
+        pd.Series: Columna numérica (NaN donde el valor no es válido)
+
+    Example:
+        >>> parse_num_column(pd.Series(["$1,234.56", "abc", 5]))
+        0    1234.56
+        1        NaN
+        2       5.00
+        dtype: float64
+    """
+    types = pd.api.types
+
+    # Fechas, duraciones y booleanos no son montos
+    if (
+        types.is_bool_dtype(series)
+        or types.is_datetime64_any_dtype(series)
+        or types.is_timedelta64_dtype(series)
+    ):
+        return pd.Series(float("nan"), index=series.index)
+
+    if types.is_numeric_dtype(series):
+        return series
+
+    cleaned = series.astype(str).str.replace(_CURRENCY_RE, "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce")
@@ -8,9 +8,12 @@ Autor: Omar Gabriel Salvatierra Garcia
 Organización: Órgano de Fiscalización Superior del Estado de Tlaxcala
 """
 
+import os
 from typing import Tuple
 from werkzeug.datastructures import FileStorage
 
+from config import Config
+
 
 def validate_file(file: FileStorage) -> Tuple[bool, str]:
     """
@@ -29,15 +32,15 @@ def validate_file(file: FileStorage) -> Tuple[bool, str]:
         >>> is_valid
         True
     """
-    if not file or file.filename == "":
+    if not file or not file.filename:
         return False, "No se proporcionó ningún archivo."
 
     # Validar extensión
-    if not file.filename or "." not in file.filename:
+    extension = os.path.splitext(file.filename)[1][1:].lower()
+    if not extension:
         return False, "El archivo debe tener una extensión válida."
 
-    extension = file.filename.rsplit(".", 1)[1].lower()
-    if extension not in {"xlsx", "xls"}:
+    if extension not in Config.ALLOWED_EXTENSIONS:
         return False, "Solo se permiten archivos Excel (.xlsx, .xls)."
 
     return True, ""
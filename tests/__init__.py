@@ -0,0 +1,6 @@
+"""
+LexNum - Tests
+==============
+
+Pruebas unitarias de los módulos de LexNum.
+"""
@@ -0,0 +1,38 @@
+"""
+LexNum - Configuración de pytest
+=================================
+
+Fixtures compartidas por las pruebas.
+"""
+
+import io
+import os
+
+# Las pruebas no escriben en log/lexnum.log (debe definirse antes de importar Config)
+os.environ.setdefault("LOG_TO_FILE", "False")
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def client():
+    """Cliente de pruebas de Flask."""
+    from app import app
+
+    app.config["TESTING"] = True
+    with app.test_client() as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def excel_upload():
+    """Construye el formulario de /convertir_excel con un DataFrame como .xlsx."""
+
+    def build(df: pd.DataFrame, filename: str = "montos.xlsx") -> dict:
+        buf = io.BytesIO()
+        df.to_excel(buf, index=False, engine="xlsxwriter")
+        buf.seek(0)
+        return {"archivo": (buf, filename)}
+
+    return build
@@ -0,0 +1,130 @@
+"""
+LexNum - Pruebas de endpoints
+==============================
+
+Pruebas de app.py con el cliente de pruebas de Flask.
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+MONTOS = pd.DataFrame({"Número": [1523.45, 1, None, "$1,234.56"]})
+TEXTOS = [
+    "MIL QUINIENTOS VEINTITRÉS PESOS 45/100 M.N.",
+    "UN PESO 00/100 M.N.",
+    "",
+    "MIL DOSCIENTOS TREINTA Y CUATRO PESOS 56/100 M.N.",
+]
+
+
+# =========================================================
+# FORMATO DE SALIDA (XLSX / CSV)
+# =========================================================
+def _assert_csv(response):
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert "filename=resultado_lexnum.csv" in response.headers["Content-Disposition"]
+
+    body = response.get_data()
+    assert body.startswith(b"\xef\xbb\xbf")
+
+    df = pd.read_csv(io.BytesIO(body), encoding="utf-8-sig", keep_default_na=False)
+    assert df.columns.tolist() == ["Número", "Texto"]
+    assert df["Texto"].tolist() == TEXTOS
+
+
+def _assert_xlsx(response):
+    assert response.status_code == 200
+    assert response.mimetype == XLSX_MIMETYPE
+    assert "filename=resultado_lexnum.xlsx" in response.headers["Content-Disposition"]
+
+    df = pd.read_excel(io.BytesIO(response.get_data()), engine="calamine")
+    assert df["Texto"].fillna("").tolist() == TEXTOS
+
+
+def test_convertir_excel_csv_query_param(client, excel_upload):
+    response = client.post("/convertir_excel?format=csv", data=excel_upload(MONTOS))
+    _assert_csv(response)
+
+
+def test_convertir_excel_csv_accept_header(client, excel_upload):
+    response = client.post(
+        "/convertir_excel",
+        data=excel_upload(MONTOS),
+        headers={"Accept": "text/csv"},
+    )
+    _assert_csv(response)
+
+
+@pytest.mark.parametrize("headers", [{}, {"Accept": "*/*"}])
+def test_convertir_excel_defaults_to_xlsx(client, excel_upload, headers):
+    response = client.post("/convertir_excel", data=excel_upload(MONTOS), headers=headers)
+    _assert_xlsx(response)
+
+
+# =========================================================
+# ENVÍO DEL ARCHIVO GENERADO
+# =========================================================
+@pytest.fixture
+def spools(monkeypatch):
+    """Registra los SpooledTemporaryFile creados por convertir_excel."""
+    import app as app_module
+
+    created = []
+    original = app_module.tempfile.SpooledTemporaryFile
+
+    def spy(*args, **kwargs):
+        spool = original(*args, **kwargs)
+        created.append(spool)
+        return spool
+
+    monkeypatch.setattr(app_module.tempfile, "SpooledTemporaryFile", spy)
+    return created
+
+
+@pytest.mark.parametrize("query", ["", "?format=csv"])
+def test_send_output_from_memory(client, excel_upload, spools, query):
+    response = client.post("/convertir_excel" + query, data=excel_upload(MONTOS))
+    body = response.get_data()
+    response.close()
+
+    assert response.status_code == 200
+    assert response.content_length == len(body)
+    assert not spools[0]._rolled
+    assert spools[0].closed
+
+
+@pytest.mark.parametrize("query", ["", "?format=csv"])
+def test_send_output_from_rolled_over_file(
+    client, excel_upload, spools, monkeypatch, query
+):
+    import app as app_module
+
+    monkeypatch.setattr(app_module, "_SPOOL_MAX_SIZE", 64)
+    response = client.post("/convertir_excel" + query, data=excel_upload(MONTOS))
+    body = response.get_data()
+    response.close()
+
+    assert response.status_code == 200
+    assert len(body) > 64
+    assert response.content_length == len(body)
+    assert spools[0]._rolled
+    assert spools[0].closed
+
+
+def test_send_output_closes_spool_on_write_error(
+    client, excel_upload, spools, monkeypatch
+):
+    def fail(*args, **kwargs):
+        raise RuntimeError("fallo al escribir")
+
+    upload = excel_upload(MONTOS)
+    monkeypatch.setattr(pd.DataFrame, "to_excel", fail)
+    response = client.post("/convertir_excel", data=upload)
+
+    assert response.status_code == 500
+    assert spools[0].closed
@@ -0,0 +1,148 @@
+"""
+LexNum - Pruebas de conversión de números a texto
+==================================================
+
+Pruebas para scripts/converter.py. El convertidor por tablas se compara
+contra num2words (con el apócope "UNO" → "UN") para garantizar que el
+texto monetario no cambia respecto al generado con la librería.
+"""
+
+import random
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from num2words import num2words
+
+from scripts import converter
+from scripts.converter import (
+    _UNO_RE, _int_to_es, convertir_valores, float_a_texto, numero_a_texto,
+)
+
+
+def _num2words_es(n: int) -> str:
+    """Texto de referencia: num2words en mayúsculas con apócope de "UNO"."""
+    return _UNO_RE.sub("UN", num2words(n, lang="es").upper())
+
+
+# =========================================================
+# PARIDAD CON NUM2WORDS
+# =========================================================
+def test_int_to_es_parity_0_to_100000():
+    mismatches = [
+        n for n in range(100_001) if _int_to_es(n) != _num2words_es(n)
+    ]
+    assert mismatches == []
+
+
+def test_int_to_es_parity_random_up_to_10_12():
+    rng = random.Random(2025)
+    samples = [rng.randrange(10**digits) for digits in range(6, 13) for _ in range(2000)]
+    mismatches = [n for n in samples if _int_to_es(n) != _num2words_es(n)]
+    assert mismatches == []
+
+
+@pytest.mark.parametrize("n", [
+    10**6,
+    10**6 + 1,
+    2 * 10**6,
+    21 * 10**6,
+    21_021_021,
+    101 * 10**6,
+    10**9,
+    10**9 + 1,
+    10**9 + 10**6,
+    1001 * 10**6,
+    21_000 * 10**6,
+    999_999_999_999,
+    10**12,
+    10**12 + 1,
+    21 * 10**12,
+])
+def test_int_to_es_parity_millions_and_billions(n):
+    assert _int_to_es(n) == _num2words_es(n)
+
+
+# =========================================================
+# APÓCOPE "UNO" → "UN"
+# =========================================================
+def test_uno_re_apocopates_separate_words():
+    assert _UNO_RE.sub("UN", "UNO MIL UNO") == "UN MIL UN"
+
+
+def test_uno_re_keeps_veintiuno_alone():
+    assert _UNO_RE.sub("UN", "VEINTIUNO") == "VEINTIUNO"
+
+
+def test_uno_re_apocopates_before_mil():
+    assert _UNO_RE.sub("UN", "VEINTIUNO MIL") == "VEINTIUN MIL"
+
+
+@pytest.mark.parametrize("valor, esperado", [
+    (21, "VEINTIUNO PESOS 00/100 M.N."),
+    (31, "TREINTA Y UN PESOS 00/100 M.N."),
+    (1001, "MIL UN PESOS 00/100 M.N."),
+    (21000, "VEINTIUN MIL PESOS 00/100 M.N."),
+])
+def test_numero_a_texto_apocope(valor, esperado):
+    assert numero_a_texto(valor) == esperado
+
+
+# =========================================================
+# SEPARACIÓN DE PESOS Y CENTAVOS
+# =========================================================
+def test_numero_a_texto_float_sum_regression():
+    assert numero_a_texto(0.1 + 0.2) == "CERO PESOS 30/100 M.N."
+
+
+def test_numero_a_texto_rounds_centavos_into_pesos():
+    assert numero_a_texto(99.999) == "CIEN PESOS 00/100 M.N."
+
+
+@pytest.mark.parametrize("valor, esperado", [
+    (-5.5, "MENOS CINCO PESOS 50/100 M.N."),
+    (-0.5, "MENOS CERO PESOS 50/100 M.N."),
+    (-1, "MENOS UN PESO 00/100 M.N."),
+])
+def test_numero_a_texto_negative_amounts(valor, esperado):
+    assert numero_a_texto(valor) == esperado
+
+
+# =========================================================
+# CONVERSIÓN EN LOTE
+# =========================================================
+def test_convertir_valores_is_serial_by_default():
+    valores = [i * 7.13 for i in range(converter.PARALLEL_THRESHOLD + 1)]
+    assert convertir_valores(valores) == [float_a_texto(v) for v in valores]
+    assert converter._EXECUTOR is None
+
+
+@pytest.fixture
+def parallel(monkeypatch):
+    """Activa el pool con 2 procesos y un umbral bajo; lo cierra al final."""
+    monkeypatch.setattr(converter, "_WORKERS", 2)
+    monkeypatch.setattr(converter, "PARALLEL_THRESHOLD", 10)
+    yield
+    if converter._EXECUTOR is not None:
+        converter._EXECUTOR.shutdown(wait=True)
+    converter._EXECUTOR = None
+
+
+def test_convertir_valores_parallel_matches_serial(parallel):
+    valores = [i * 7.13 - 500 for i in range(200)]
+    assert convertir_valores(valores) == [float_a_texto(v) for v in valores]
+    assert converter._EXECUTOR is not None
+
+
+def test_convertir_valores_falls_back_to_serial_on_broken_pool(
+    parallel, monkeypatch
+):
+    class BrokenExecutor:
+        def map(self, *args, **kwargs):
+            raise BrokenProcessPool("sin procesos")
+
+    monkeypatch.setattr(converter, "_get_executor", BrokenExecutor)
+    valores = [i * 7.13 for i in range(50)]
+
+    assert convertir_valores(valores) == [float_a_texto(v) for v in valores]
+    assert converter._WORKERS == 1
+    assert converter._EXECUTOR is None
@@ -0,0 +1,74 @@
+"""
+LexNum - Pruebas de procesamiento de Excel
+===========================================
+
+Pruebas para scripts/excel_processor.py.
+"""
+
+import pandas as pd
+import pytest
+
+from scripts.excel_processor import find_num_column, normalize, parse_num_column
+
+
+# =========================================================
+# NORMALIZACIÓN DE ENCABEZADOS
+# =========================================================
+@pytest.mark.parametrize("header", [
+    "Número",
+    "  Num  ",
+    "NÚMERO",
+    "Nu\tmero",
+    "N\xa0úmero",
+    "Nu\u0301mero",
+    "Nùmero",
+    "N\u2003umero",
+])
+def test_normalize_matches_aliases(header):
+    assert normalize(header) in {"numero", "num"}
+
+
+def test_normalize_non_string():
+    assert normalize(5) == "5"
+
+
+# =========================================================
+# BÚSQUEDA DE LA COLUMNA DE NÚMEROS
+# =========================================================
+@pytest.mark.parametrize("columns, esperado", [
+    (["Concepto", "Número"], "Número"),
+    (["Num", "Número"], "Num"),
+    (["Núm", "Numero"], "Núm"),
+    (["Concepto", " nu\u0301mero "], " nu\u0301mero "),
+    (["Concepto", "Importe"], None),
+])
+def test_find_num_column_first_match_by_position(columns, esperado):
+    assert find_num_column(pd.DataFrame(columns=columns)) == esperado
+
+
+# =========================================================
+# CONVERSIÓN NUMÉRICA DE LA COLUMNA
+# =========================================================
+def test_parse_num_column_cleans_text_amounts():
+    result = parse_num_column(pd.Series(["$1,234.56", "12 M.N.", "abc", None]))
+    assert result.tolist()[:2] == [1234.56, 12.0]
+    assert result[2:].isna().all()
+
+
+def test_parse_num_column_keeps_numeric_columns():
+    series = pd.Series([1, 2, 3])
+    assert parse_num_column(series) is series
+
+
+@pytest.mark.parametrize("series", [
+    pd.Series(pd.to_datetime(["2025-01-01", "2025-02-01"])),
+    pd.Series([True, False]),
+    pd.Series(pd.to_timedelta(["1 day", "2 days"])),
+])
+def test_parse_num_column_rejects_dates_and_booleans(series):
+    assert parse_num_column(series).isna().all()
+
+
+def test_parse_num_column_rejects_booleans_in_object_column():
+    assert parse_num_column(pd.Series([True, "5"], dtype=object)).tolist()[1] == 5.0
+    assert pd.isna(parse_num_column(pd.Series([True, "5"], dtype=object))[0])